@@ -1,8 +1,12 @@
 # Centralized configuration — clean transform-only version
+import copy
+import functools
 import json
 import os
 import uuid
-from typing import Any, Dict, List
+from dataclasses import asdict, dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
 from pathlib import Path
 
 PARENT_DIR = Path(__file__).resolve().parent
@@ -12,37 +16,56 @@ DEFAULT_TEXT_FOLDER = str(PARENT_DIR / "Data" / "Source")
 PROCESSED_FOLDER = os.path.join(PARENT_DIR, "Processed Database")
 SETTINGS_FILE = os.path.join(PARENT_DIR, "user_settings.json")
 
-MODEL_CATALOG = {
-    "gpt-4.1": {
-        "name": "GPT-4.1",
-        "input_price_per_1m": 2.0,
-        "output_price_per_1m": 8.0,
-        "notes": "Flagship model, best quality.",
-    },
-    "gpt-4.1-mini": {
-        "name": "GPT-4.1 Mini",
-        "input_price_per_1m": 0.6,
-        "output_price_per_1m": 2.4,
-        "notes": "Faster and cheaper, good for most tasks.",
-    },
-    "gpt-4.1-nano": {
-        "name": "GPT-4.1 Nano",
-        "input_price_per_1m": 0.2,
-        "output_price_per_1m": 0.8,
-        "notes": "Fastest, lowest cost.",
-    },
+
+@dataclass(frozen=True, slots=True)
+class ModelInfo:
+    id: str
+    name: str
+    input_price_per_1m: float
+    output_price_per_1m: float
+    notes: str | None = None
+
+
+MODEL_CATALOG: Dict[str, ModelInfo] = {
+    info.id: info
+    for info in (
+        ModelInfo(
+            id="gpt-4.1",
+            name="GPT-4.1",
+            input_price_per_1m=2.0,
+            output_price_per_1m=8.0,
+            notes="Flagship model, best quality.",
+        ),
+        ModelInfo(
+            id="gpt-4.1-mini",
+            name="GPT-4.1 Mini",
+            input_price_per_1m=0.6,
+            output_price_per_1m=2.4,
+            notes="Faster and cheaper, good for most tasks.",
+        ),
+        ModelInfo(
+            id="gpt-4.1-nano",
+            name="GPT-4.1 Nano",
+            input_price_per_1m=0.2,
+            output_price_per_1m=0.8,
+            notes="Fastest, lowest cost.",
+        ),
+    )
 }
-SUPPORTED_MODELS: tuple[str, ...] = tuple(MODEL_CATALOG.keys())
-DEFAULT_MODEL = SUPPORTED_MODELS[0]
+SUPPORTED_MODEL_ORDER: tuple[str, ...] = tuple(MODEL_CATALOG)
+SUPPORTED_MODELS: frozenset[str] = frozenset(MODEL_CATALOG)
+DEFAULT_MODEL = SUPPORTED_MODEL_ORDER[0]
 DEFAULT_TEMPERATURE = 0.7
 DEFAULT_TOP_P = 1.0
 DEFAULT_PROMPT_ID = "default"
 DEFAULT_OUTPUT_FORMAT = ".txt"
 
+_VALID_OUTPUT_FORMATS = frozenset({".txt", ".md"})
+_VALID_THEMES = frozenset({"dark", "light"})
 
-def _normalize_text_folder(path: str | None) -> str | None:
-    if not path or not isinstance(path, str):
-        return None
+
+@functools.lru_cache(maxsize=64)
+def _resolve_folder(path: str) -> str:
     candidate = Path(path).expanduser()
     if not candidate.is_absolute():
         candidate = (PARENT_DIR / candidate).resolve()
@@ -51,33 +74,81 @@ def _normalize_text_folder(path: str | None) -> str | None:
     return str(candidate)
 
 
+def _normalize_text_folder(path: str | None) -> str | None:
+    if not path or not isinstance(path, str):
+        return None
+    return _resolve_folder(path)
+
+
 _text_folder = _normalize_text_folder(DEFAULT_TEXT_FOLDER)
 
 
-def _load_settings() -> Dict[str, Any]:
-    """Load persisted settings from disk, returning an empty dict on error."""
-    if not os.path.exists(SETTINGS_FILE):
-        return {}
+_settings_cache: Dict[str, Any] | None = None
+_settings_mtime: int | None = None
+
+
+def _cached_settings() -> Dict[str, Any]:
+    """Return the shared settings dict, re-reading disk only when the file changes.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    global _settings_cache, _settings_mtime
     try:
-        with open(SETTINGS_FILE, "r", encoding="utf-8") as fh:
-            loaded = json.load(fh)
-            return loaded if isinstance(loaded, dict) else {}
-    except (OSError, ValueError):
-        return {}
+        mtime = os.stat(SETTINGS_FILE).st_mtime_ns
+    except OSError:
+        mtime = None
+    if _settings_cache is not None and mtime == _settings_mtime:
+        return _settings_cache
+    loaded: Any = {}
+    if mtime is not None:
+        try:
+            with open(SETTINGS_FILE, "r", encoding="utf-8") as fh:
+                loaded = json.load(fh)
+        except (OSError, ValueError):
+            loaded = {}
+    _settings_cache = loaded if isinstance(loaded, dict) else {}
+    _settings_mtime = mtime
+    return _settings_cache
+
+
+def _load_settings() -> Dict[str, Any]:
+    """Load persisted settings as a private copy the caller may modify."""
+    return copy.deepcopy(_cached_settings())
 
 
 def _save_settings(settings: Dict[str, Any]) -> None:
+    global _settings_cache, _settings_mtime
+    payload = json.dumps(settings, indent=2, ensure_ascii=False)
     os.makedirs(os.path.dirname(SETTINGS_FILE) or ".", exist_ok=True)
-    with open(SETTINGS_FILE, "w", encoding="utf-8") as fh:
-        json.dump(settings, fh, indent=2)
+    tmp_path = SETTINGS_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        fh.write(payload)
+    os.replace(tmp_path, SETTINGS_FILE)
+    _settings_cache = settings
+    try:
+        _settings_mtime = os.stat(SETTINGS_FILE).st_mtime_ns
+    except OSError:
+        _settings_mtime = None
+
+
+@functools.cache
+def _ensure_dir(path: str) -> str:
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def ensure_processed_folder() -> str:
+    """Create the processed-output folder on first use and return its path."""
+    return _ensure_dir(PROCESSED_FOLDER)
 
 
 def get_text_folder() -> str:
-    return _text_folder
+    return _ensure_dir(_text_folder)
 
 
 def set_text_folder(new_path: str) -> None:
     """Persist the folder the UI should monitor for .txt files."""
+    _resolve_folder.cache_clear()
     normalized = _normalize_text_folder(new_path)
     if not normalized:
         raise ValueError("Text folder path cannot be empty.")
@@ -90,21 +161,18 @@ def set_text_folder(new_path: str) -> None:
     _save_settings(current)
 
 
-def get_model_catalog() -> List[Dict[str, Any]]:
-    return [
-        {
-            "id": model_id,
-            "name": payload.get("name", model_id),
-            "input_price_per_1m": payload.get("input_price_per_1m", 0.0),
-            "output_price_per_1m": payload.get("output_price_per_1m", 0.0),
-            "notes": payload.get("notes"),
-        }
-        for model_id, payload in MODEL_CATALOG.items()
-    ]
+_MODEL_CATALOG_VIEW: tuple[Mapping[str, Any], ...] = tuple(
+    MappingProxyType(asdict(info)) for info in MODEL_CATALOG.values()
+)
+
+
+def get_model_catalog() -> List[Mapping[str, Any]]:
+    """Return read-only catalog entries; the entries are built once at import."""
+    return list(_MODEL_CATALOG_VIEW)
 
 
 def get_model_settings() -> Dict[str, Any]:
-    settings = _load_settings()
+    settings = _cached_settings()
     model = settings.get("model", DEFAULT_MODEL)
     if model not in SUPPORTED_MODELS:
         model = DEFAULT_MODEL
@@ -119,7 +187,7 @@ def get_model_settings() -> Dict[str, Any]:
         top_p = float(top_p)
     except (TypeError, ValueError):
         top_p = DEFAULT_TOP_P
-    if output_format not in (".txt", ".md"):
+    if output_format not in _VALID_OUTPUT_FORMATS:
         output_format = DEFAULT_OUTPUT_FORMAT
     return {
         "model": model,
@@ -151,34 +219,82 @@ def set_model_settings(
             raise ValueError("top_p must be between 0 and 1")
         settings["top_p"] = top_p
     if output_format is not None:
-        if output_format not in (".txt", ".md"):
+        if output_format not in _VALID_OUTPUT_FORMATS:
             raise ValueError("output_format must be '.txt' or '.md'")
         settings["output_format"] = output_format
     _save_settings(settings)
     return get_model_settings()
 
 
-def _read_system_prompt() -> str:
+_prompt_cache: tuple[int, str] | None = None
+
+
+def read_system_prompt(missing_ok: bool = True) -> str:
+    """Return SYSTEM_PROMPT.txt, re-reading it only when its mtime changes.
+
+    An unreadable file yields "" unless *missing_ok* is False, in which case
+    the OSError propagates.
+    """
+    global _prompt_cache
     try:
+        mtime = os.stat(PROMPT_PATH).st_mtime_ns
+        if _prompt_cache is not None and _prompt_cache[0] == mtime:
+            return _prompt_cache[1]
         with open(PROMPT_PATH, "r", encoding="utf-8") as pf:
-            return pf.read()
+            text = pf.read()
     except OSError:
-        return ""
+        if missing_ok:
+            return ""
+        raise
+    _prompt_cache = (mtime, text)
+    return text
 
 
-def get_prompt_presets() -> List[Dict[str, str]]:
-    settings = _load_settings()
+def _missing_prompt_id(entry: Any) -> bool:
+    return isinstance(entry, dict) and not str(entry.get("id", "")).strip()
+
+
+_presets_cache: tuple[
+    Dict[str, Any], str, List[Dict[str, str]], Dict[str, Dict[str, str]]
+] | None = None
+
+
+def _cached_presets() -> tuple[List[Dict[str, str]], Dict[str, Dict[str, str]]]:
+    """Return the shared preset list and its id index from one settings snapshot.
+
+    Both are rebuilt together only when the cached settings dict or the
+    system prompt text changes; callers must not mutate either.
+    """
+    global _presets_cache
+    settings = _cached_settings()
+    system_prompt = read_system_prompt()
+    if (
+        _presets_cache is not None
+        and _presets_cache[0] is settings
+        and _presets_cache[1] is system_prompt
+    ):
+        return _presets_cache[2], _presets_cache[3]
     presets = settings.get("prompts", [])
     if not isinstance(presets, list):
         presets = []
+    if any(_missing_prompt_id(entry) for entry in presets):
+        # Persist generated ids once so they stay stable across reads.
+        fixed = _load_settings()
+        presets = fixed["prompts"]
+        for entry in presets:
+            if _missing_prompt_id(entry):
+                entry["id"] = str(uuid.uuid4())
+        try:
+            _save_settings(fixed)
+            settings = fixed
+        except OSError:
+            pass
     unique = []
     seen_ids = set()
     for entry in presets:
         if not isinstance(entry, dict):
             continue
         prompt_id = str(entry.get("id", "")).strip()
-        if not prompt_id:
-            prompt_id = str(uuid.uuid4())
         if prompt_id in seen_ids:
             continue
         seen_ids.add(prompt_id)
@@ -191,18 +307,27 @@ def get_prompt_presets() -> List[Dict[str, str]]:
             {
                 "id": DEFAULT_PROMPT_ID,
                 "name": "Default (SYSTEM_PROMPT.txt)",
-                "content": _read_system_prompt(),
+                "content": system_prompt,
             },
         )
-    return unique
+    by_id = {entry["id"]: entry for entry in unique}
+    _presets_cache = (settings, system_prompt, unique, by_id)
+    return unique, by_id
 
 
-def get_default_prompt_id() -> str:
-    settings = _load_settings()
+def get_prompt_presets() -> List[Dict[str, str]]:
+    prompts, _ = _cached_presets()
+    return [entry.copy() for entry in prompts]
+
+
+def get_default_prompt_id(by_id: Dict[str, Dict[str, str]] | None = None) -> str:
+    settings = _cached_settings()
     prompt_id = str(settings.get("default_prompt_id", DEFAULT_PROMPT_ID)).strip()
     if not prompt_id:
         return DEFAULT_PROMPT_ID
-    if not any(entry["id"] == prompt_id for entry in get_prompt_presets()):
+    if by_id is None:
+        _, by_id = _cached_presets()
+    if prompt_id not in by_id:
         return DEFAULT_PROMPT_ID
     return prompt_id
 
@@ -210,7 +335,8 @@ def get_default_prompt_id() -> str:
 def set_default_prompt_id(prompt_id: str) -> None:
     if not prompt_id:
         raise ValueError("Prompt id cannot be empty.")
-    if prompt_id not in {entry["id"] for entry in get_prompt_presets()}:
+    _, by_id = _cached_presets()
+    if prompt_id not in by_id:
         raise ValueError(f"Unknown prompt id: {prompt_id}")
     settings = _load_settings()
     settings["default_prompt_id"] = prompt_id
@@ -218,24 +344,21 @@ def set_default_prompt_id(prompt_id: str) -> None:
 
 
 def get_prompt(prompt_id: str | None = None) -> Dict[str, str]:
-    prompts = get_prompt_presets()
-    if prompt_id:
-        for entry in prompts:
-            if entry["id"] == prompt_id:
-                return entry.copy()
-    active_id = get_default_prompt_id()
-    for entry in prompts:
-        if entry["id"] == active_id:
-            return entry.copy()
-    return prompts[0]
+    prompts, by_id = _cached_presets()
+    entry = by_id.get(prompt_id) if prompt_id else None
+    if entry is None:
+        entry = by_id.get(get_default_prompt_id(by_id), prompts[0])
+    return entry.copy()
 
 
 def upsert_prompt(
     preset_id: str | None, name: str, content: str, set_default: bool = False
 ) -> Dict[str, str]:
-    if not name or not name.strip():
+    name = name.strip() if name else ""
+    content = str(content) if content else ""
+    if not name:
         raise ValueError("Prompt name cannot be empty.")
-    if not content or not str(content).strip():
+    if not content.strip():
         raise ValueError("Prompt content cannot be empty.")
     preset_id = (preset_id or "").strip() or str(uuid.uuid4())
     settings = _load_settings()
@@ -247,14 +370,12 @@ def upsert_prompt(
         if not isinstance(prompt, dict):
             continue
         if str(prompt.get("id", "")).strip() == preset_id:
-            prompt["name"] = name.strip()
-            prompt["content"] = str(content)
+            prompt["name"] = name
+            prompt["content"] = content
             updated = True
             break
     if not updated:
-        prompts.append(
-            {"id": preset_id, "name": name.strip(), "content": str(content)}
-        )
+        prompts.append({"id": preset_id, "name": name, "content": content})
     settings["prompts"] = prompts
     if set_default:
         settings["default_prompt_id"] = preset_id
@@ -264,13 +385,13 @@ def upsert_prompt(
 
 def get_theme() -> str:
     """Return 'dark' or 'light'."""
-    settings = _load_settings()
+    settings = _cached_settings()
     theme = settings.get("theme", "dark")
-    return theme if theme in ("dark", "light") else "dark"
+    return theme if theme in _VALID_THEMES else "dark"
 
 
 def set_theme(theme: str) -> None:
-    if theme not in ("dark", "light"):
+    if theme not in _VALID_THEMES:
         raise ValueError("Theme must be 'dark' or 'light'.")
     settings = _load_settings()
     settings["theme"] = theme
@@ -278,7 +399,7 @@ def set_theme(theme: str) -> None:
 
 
 # ---------- Initialize text folder preference ----------
-settings = _load_settings()
+settings = _cached_settings()
 if "text_folder" in settings and settings["text_folder"]:
     normalized_from_settings = _normalize_text_folder(settings["text_folder"])
     if normalized_from_settings and os.path.isdir(normalized_from_settings):
@@ -286,8 +407,3 @@ if "text_folder" in settings and settings["text_folder"]:
 
 if not _text_folder:
     _text_folder = str(PARENT_DIR)
-
-if not os.path.isdir(_text_folder):
-    os.makedirs(_text_folder, exist_ok=True)
-
-os.makedirs(PROCESSED_FOLDER, exist_ok=True)
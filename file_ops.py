@@ -1,27 +1,137 @@
 # File and clipboard operations
+import functools
+import heapq
 import os
-import glob
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from operator import itemgetter
 import pyperclip
 from datetime import datetime
-from config import get_text_folder, get_model_settings, get_prompt, PROCESSED_FOLDER
+from config import (
+    get_text_folder,
+    get_model_settings,
+    get_prompt,
+    ensure_processed_folder,
+    PROCESSED_FOLDER,
+)
 from openai_client import ask_chatgpt
 
+_clipboard_available = True
+
+# Windows uses os.startfile(); elsewhere spawn the desktop opener detached.
+if os.name == "nt":
+    _OPEN_CMD = None
+elif sys.platform == "darwin":
+    _OPEN_CMD = ("open",)
+else:
+    _OPEN_CMD = ("xdg-open",)
+
+_RECENT_TTL = 1.0
+_recent_cache = {"ts": 0.0, "key": None, "mtime": None, "val": None}
+
+
+def invalidate_recent_texts() -> None:
+    """Force the next get_recent_texts() call to rescan the folder."""
+    _recent_cache["val"] = None
+
 
 def get_recent_texts(n=30):
-    """Return up to *n* .txt files sorted by modification time (newest first)."""
-    pattern = os.path.join(get_text_folder(), "*.txt")
+    """Return up to *n* .txt files sorted by modification time (newest first).
+
+    Results are reused for up to one second while the folder's mtime is
+    unchanged, so bursts of UI refreshes share a single directory scan.
+    """
+    folder = get_text_folder()
+    try:
+        folder_mtime = os.stat(folder).st_mtime_ns
+    except OSError:
+        return []
+    key = (folder, n)
+    now = time.monotonic()
+    if (
+        _recent_cache["val"] is not None
+        and _recent_cache["key"] == key
+        and _recent_cache["mtime"] == folder_mtime
+        and now - _recent_cache["ts"] < _RECENT_TTL
+    ):
+        return list(_recent_cache["val"])
+
     entries = []
-    for f in glob.glob(pattern):
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(".") or not os.path.normcase(name).endswith(".txt"):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((entry.path, st.st_mtime, st.st_ctime))
+    except OSError:
+        return []
+    recent = heapq.nlargest(n, entries, key=itemgetter(1))
+    _recent_cache.update(ts=now, key=key, mtime=folder_mtime, val=recent)
+    return list(recent)
+
+
+def _in_background(fn, *args) -> Future:
+    """Run fn(*args) on a daemon thread and return a Future for its result.
+
+    Daemon threads never hold up interpreter exit the way executor workers do.
+    """
+    future = Future()
+
+    def _run():
+        if not future.set_running_or_notify_cancel():
+            return
         try:
-            mtime = os.path.getmtime(f)
-            ctime = os.path.getctime(f)
-            entries.append((f, mtime, ctime))
-        except OSError:
-            continue
-    entries.sort(key=lambda x: x[1], reverse=True)
-    return entries[:n]
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
 
+    threading.Thread(target=_run, name="file-io", daemon=True).start()
+    return future
 
+
+def _copy_to_clipboard(text: str) -> bool:
+    """Copy *text* to the clipboard, returning False if it could not be copied."""
+    global _clipboard_available
+    if not _clipboard_available:
+        return False
+    try:
+        pyperclip.copy(text)
+    except pyperclip.PyperclipWindowsException:
+        return False
+    except pyperclip.PyperclipException:
+        # No copy mechanism on this system; stop probing for one.
+        _clipboard_available = False
+        return False
+    except Exception:
+        return False
+    return True
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode UTF-8 file contents with universal-newline translation."""
+    text = data.decode("utf-8")
+    if b"\r" in data:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _read_text(path: str) -> str:
+    """Read a UTF-8 text file in one read."""
+    with open(path, "rb") as fh:
+        return _decode_text(fh.read())
+
+
+@functools.lru_cache(maxsize=4096)
 def get_processed_path(original_path: str, extension: str = ".txt") -> str:
     """Map an original file path to its processed output path."""
     base = os.path.basename(original_path)
@@ -46,19 +156,17 @@ def process_file(path, log_fn, model=None, prompt_id=None, prompt_text=None,
         prompt_text = get_prompt(prompt_id).get("content", "")
 
     base = os.path.basename(path)
-    name, _ = os.path.splitext(base)
 
-    log_fn(f"\U0001f4c4 Selected file: {base}")
-    log_fn("\U0001f4dd Reading transcript from text file\u2026")
+    log_fn(f"\U0001f4c4 Selected file: {base}\n"
+           "\U0001f4dd Reading transcript from text file\u2026")
     try:
-        with open(path, "r", encoding="utf-8") as tf:
-            transcript = tf.read()
+        transcript = _read_text(path)
     except Exception as e:
         log_fn(f"\u26a0\ufe0f Read error: {e}")
         return False
 
-    log_fn(f"\u2705 Loaded transcript ({len(transcript):,} chars)")
-    log_fn(f"\U0001f4ac Sending to {model} (temp={temperature}, top_p={top_p})\u2026")
+    log_fn(f"\u2705 Loaded transcript ({len(transcript):,} chars)\n"
+           f"\U0001f4ac Sending to {model} (temp={temperature}, top_p={top_p})\u2026")
 
     try:
         outline, stats = ask_chatgpt(
@@ -72,16 +180,14 @@ def process_file(path, log_fn, model=None, prompt_id=None, prompt_text=None,
         log_fn(f"\u26a0\ufe0f ChatGPT error: {e}")
         return False
 
-    # Copy to clipboard
+    # Copy to clipboard while the outline is saved
     log_fn("\U0001f4e5 Copying outline to clipboard\u2026")
-    try:
-        pyperclip.copy(outline)
-    except Exception:
-        log_fn("\u26a0\ufe0f Clipboard copy failed (pyperclip issue).")
+    clipboard = _in_background(_copy_to_clipboard, outline)
 
     # Save to processed folder
-    outfile = os.path.join(PROCESSED_FOLDER, f"{name}{output_format}")
+    outfile = get_processed_path(path, output_format)
     try:
+        ensure_processed_folder()
         with open(outfile, "w", encoding="utf-8") as f:
             f.write(outline)
         log_fn(f"\U0001f4be Saved outline to: {outfile}")
@@ -89,26 +195,43 @@ def process_file(path, log_fn, model=None, prompt_id=None, prompt_text=None,
         log_fn(f"\u26a0\ufe0f File save error: {e}")
         return False
 
-    log_fn("\u2705 Done! Outline is now in your clipboard.")
-    log_fn("")
-    log_fn("\U0001f4ca Usage Details:")
-    log_fn(f"   \u2022 Model: {stats['model']}")
-    log_fn(f"   \u2022 Prompt tokens: {stats['prompt_tokens']:,}")
-    log_fn(f"   \u2022 Completion tokens: {stats['completion_tokens']:,}")
-    log_fn(f"   \u2022 Total tokens: {stats['total_tokens']:,}")
-    log_fn(f"   \u2022 Response time: {stats['response_time']}s")
-    log_fn("\u2014" * 40)
+    if not clipboard.result():
+        log_fn("\u26a0\ufe0f Clipboard copy failed (pyperclip issue).")
+
+    log_fn("\n".join([
+        "\u2705 Done! Outline is now in your clipboard.",
+        "",
+        "\U0001f4ca Usage Details:",
+        f"   \u2022 Model: {stats['model']}",
+        f"   \u2022 Prompt tokens: {stats['prompt_tokens']:,}",
+        f"   \u2022 Completion tokens: {stats['completion_tokens']:,}",
+        f"   \u2022 Total tokens: {stats['total_tokens']:,}",
+        f"   \u2022 Response time: {stats['response_time']}s",
+        "\u2014" * 40,
+    ]))
     return True
 
 
 def open_file(path: str, log_fn) -> None:
-    """Open a file with the OS default application."""
+    """Open a file with the OS default application without waiting for it."""
     try:
-        if not os.path.exists(path):
-            log_fn(f"\u26a0\ufe0f File not found: {path}")
-            return
-        os.startfile(path)
+        if _OPEN_CMD is None:
+            os.startfile(path)
+        else:
+            os.stat(path)
+            subprocess.Popen(
+                (*_OPEN_CMD, path),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
         log_fn(f"\U0001f4c2 Opened: {os.path.basename(path)}")
+    except FileNotFoundError as e:
+        # A missing opener (e.g. no xdg-open) reports its own name instead.
+        if e.filename == path:
+            log_fn(f"\u26a0\ufe0f File not found: {path}")
+        else:
+            log_fn(f"\u26a0\ufe0f Could not open file: {e}")
     except Exception as e:
         log_fn(f"\u26a0\ufe0f Could not open file: {e}")
 
@@ -121,15 +244,14 @@ def open_processed_for(original_path: str, log_fn, output_format: str = ".txt")
 def copy_processed_for(original_path: str, log_fn, output_format: str = ".txt") -> None:
     processed = get_processed_path(original_path, output_format)
     try:
-        if not os.path.exists(processed):
-            log_fn(f"\u26a0\ufe0f Processed file not found: {processed}")
-            return
-        with open(processed, "r", encoding="utf-8") as f:
-            content = f.read()
-        if not content:
-            log_fn(f"\u26a0\ufe0f Processed file is empty: {processed}")
-            return
-        pyperclip.copy(content)
+        with open(processed, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                log_fn(f"\u26a0\ufe0f Processed file is empty: {processed}")
+                return
+            data = fh.read()
+        pyperclip.copy(_decode_text(data))
         log_fn(f"\U0001f4cb Copied processed outline for: {os.path.basename(original_path)}")
+    except FileNotFoundError:
+        log_fn(f"\u26a0\ufe0f Processed file not found: {processed}")
     except Exception as e:
         log_fn(f"\u26a0\ufe0f Could not copy processed file: {e}")
@@ -1,15 +1,21 @@
 # --------------------------------------------------------------------------- #
 #  gui.py — Modern Transform GUI with customization panel                      #
 # --------------------------------------------------------------------------- #
+import collections
 import tkinter as tk
 from tkinter import messagebox, ttk, filedialog
 from tkinter.scrolledtext import ScrolledText
+import time
+import queue
 import threading
-from datetime import datetime
+import traceback
 import os
+import stat
+from dataclasses import dataclass
 
 from file_ops import (
     get_recent_texts,
+    invalidate_recent_texts,
     process_file,
     open_file,
     open_processed_for,
@@ -25,150 +31,260 @@ from config import (
     get_prompt_presets,
     get_prompt,
     get_default_prompt_id,
-    set_default_prompt_id,
     upsert_prompt,
-    SUPPORTED_MODELS,
+    SUPPORTED_MODEL_ORDER,
     get_theme,
     set_theme,
 )
 from openai_client import is_configured
 
 # -- Theme palettes --------------------------------------------------------- #
+@dataclass(frozen=True, slots=True)
+class Palette:
+    bg: str
+    bg_alt: str
+    surface: str
+    surface_hl: str
+    text: str
+    text_dim: str
+    accent: str
+    accent_hover: str
+    accent_press: str
+    green: str
+    red: str
+    yellow: str
+    border: str
+    tree_bg: str
+    tree_fg: str
+    tree_sel_bg: str
+    tree_sel_fg: str
+    log_bg: str
+    log_fg: str
+    entry_bg: str
+    entry_fg: str
+    btn_fg: str
+
+
 THEMES = {
-    "dark": {
-        "bg":           "#1e1e2e",
-        "bg_alt":       "#181825",
-        "surface":      "#313244",
-        "surface_hl":   "#45475a",
-        "text":         "#cdd6f4",
-        "text_dim":     "#a6adc8",
-        "accent":       "#89b4fa",
-        "accent_hover": "#74c7ec",
-        "accent_press": "#b4befe",
-        "green":        "#a6e3a1",
-        "red":          "#f38ba8",
-        "yellow":       "#f9e2af",
-        "border":       "#585b70",
-        "tree_bg":      "#1e1e2e",
-        "tree_fg":      "#cdd6f4",
-        "tree_sel_bg":  "#45475a",
-        "tree_sel_fg":  "#cdd6f4",
-        "log_bg":       "#11111b",
-        "log_fg":       "#a6adc8",
-        "entry_bg":     "#313244",
-        "entry_fg":     "#cdd6f4",
-        "btn_fg":       "#1e1e2e",
-    },
-    "light": {
-        "bg":           "#eff1f5",
-        "bg_alt":       "#e6e9ef",
-        "surface":      "#ccd0da",
-        "surface_hl":   "#bcc0cc",
-        "text":         "#4c4f69",
-        "text_dim":     "#6c6f85",
-        "accent":       "#1e66f5",
-        "accent_hover": "#2a6ef5",
-        "accent_press": "#0550d4",
-        "green":        "#40a02b",
-        "red":          "#d20f39",
-        "yellow":       "#df8e1d",
-        "border":       "#9ca0b0",
-        "tree_bg":      "#eff1f5",
-        "tree_fg":      "#4c4f69",
-        "tree_sel_bg":  "#bcc0cc",
-        "tree_sel_fg":  "#4c4f69",
-        "log_bg":       "#e6e9ef",
-        "log_fg":       "#5c5f77",
-        "entry_bg":     "#ccd0da",
-        "entry_fg":     "#4c4f69",
-        "btn_fg":       "#ffffff",
-    },
+    "dark": Palette(
+        bg="#1e1e2e",
+        bg_alt="#181825",
+        surface="#313244",
+        surface_hl="#45475a",
+        text="#cdd6f4",
+        text_dim="#a6adc8",
+        accent="#89b4fa",
+        accent_hover="#74c7ec",
+        accent_press="#b4befe",
+        green="#a6e3a1",
+        red="#f38ba8",
+        yellow="#f9e2af",
+        border="#585b70",
+        tree_bg="#1e1e2e",
+        tree_fg="#cdd6f4",
+        tree_sel_bg="#45475a",
+        tree_sel_fg="#cdd6f4",
+        log_bg="#11111b",
+        log_fg="#a6adc8",
+        entry_bg="#313244",
+        entry_fg="#cdd6f4",
+        btn_fg="#1e1e2e",
+    ),
+    "light": Palette(
+        bg="#eff1f5",
+        bg_alt="#e6e9ef",
+        surface="#ccd0da",
+        surface_hl="#bcc0cc",
+        text="#4c4f69",
+        text_dim="#6c6f85",
+        accent="#1e66f5",
+        accent_hover="#2a6ef5",
+        accent_press="#0550d4",
+        green="#40a02b",
+        red="#d20f39",
+        yellow="#df8e1d",
+        border="#9ca0b0",
+        tree_bg="#eff1f5",
+        tree_fg="#4c4f69",
+        tree_sel_bg="#bcc0cc",
+        tree_sel_fg="#4c4f69",
+        log_bg="#e6e9ef",
+        log_fg="#5c5f77",
+        entry_bg="#ccd0da",
+        entry_fg="#4c4f69",
+        btn_fg="#ffffff",
+    ),
 }
 
+MAX_WORKERS = 4
+MAX_LOG_LINES = 2000
+
 FONT_FAMILY = "Segoe UI"
 MONO_FAMILY = "Cascadia Code"
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M"
 
 
 # -- Helpers ----------------------------------------------------------------- #
 
-def _apply_theme(root, style, theme_name):
-    """Apply the full colour palette to the root window and ttk styles."""
-    t = THEMES[theme_name]
+def _first_index(items):
+    """Map each item to the position of its first occurrence."""
+    index = {}
+    for i, item in enumerate(items):
+        index.setdefault(item, i)
+    return index
 
-    root.configure(bg=t["bg"])
 
-    # --- ttk styles ---
-    style.configure(".", background=t["bg"], foreground=t["text"],
-                     font=(FONT_FAMILY, 10))
+def _format_ts(ts):
+    """Format an epoch timestamp for the file list."""
+    return time.strftime(TIMESTAMP_FORMAT, time.localtime(ts))
 
-    # Treeview
-    style.configure("Treeview",
-                     background=t["tree_bg"], foreground=t["tree_fg"],
-                     fieldbackground=t["tree_bg"],
-                     rowheight=28, font=(FONT_FAMILY, 10),
-                     borderwidth=0)
-    style.map("Treeview",
-              background=[("selected", t["tree_sel_bg"])],
-              foreground=[("selected", t["tree_sel_fg"])])
-    style.configure("Treeview.Heading",
-                     background=t["surface"], foreground=t["text"],
-                     font=(FONT_FAMILY, 10, "bold"), relief="flat")
-    style.map("Treeview.Heading",
-              background=[("active", t["surface_hl"])])
-
-    # Buttons
-    style.configure("App.TButton",
-                     font=(FONT_FAMILY, 9, "bold"), padding=(12, 5),
-                     background=t["surface"], foreground=t["text"])
-    style.map("App.TButton",
-              background=[("active", t["surface_hl"]), ("pressed", t["border"])],
-              foreground=[("disabled", t["text_dim"])])
-
-    style.configure("Accent.TButton",
-                     font=(FONT_FAMILY, 9, "bold"), padding=(14, 5),
-                     background=t["accent"], foreground=t["btn_fg"])
-    style.map("Accent.TButton",
-              background=[("active", t["accent_hover"]), ("pressed", t["accent_press"])],
-              foreground=[("disabled", t["text_dim"])])
-
-    # Labels, Frames, Notebooks
-    style.configure("TLabel", background=t["bg"], foreground=t["text"],
-                     font=(FONT_FAMILY, 10))
-    style.configure("TFrame", background=t["bg"])
-    style.configure("TLabelframe", background=t["bg"], foreground=t["text"],
-                     font=(FONT_FAMILY, 10, "bold"))
-    style.configure("TLabelframe.Label", background=t["bg"], foreground=t["accent"],
-                     font=(FONT_FAMILY, 10, "bold"))
-    style.configure("TNotebook", background=t["bg"])
-    style.configure("TNotebook.Tab", background=t["surface"], foreground=t["text"],
-                     padding=(12, 4), font=(FONT_FAMILY, 9))
-    style.map("TNotebook.Tab",
-              background=[("selected", t["accent"])],
-              foreground=[("selected", t["btn_fg"])])
-
-    # Combobox
-    style.configure("TCombobox",
-                     fieldbackground=t["entry_bg"], foreground=t["entry_fg"],
-                     background=t["surface"], arrowcolor=t["accent"],
-                     font=(FONT_FAMILY, 10))
-    style.map("TCombobox",
-              fieldbackground=[("readonly", t["entry_bg"])],
-              foreground=[("readonly", t["entry_fg"])])
-
-    # Scale
-    style.configure("TScale", background=t["bg"], troughcolor=t["surface"],
-                     sliderthickness=18)
-
-    # Progressbar
-    style.configure("Horizontal.TProgressbar",
-                     background=t["accent"], troughcolor=t["surface"],
-                     thickness=6)
-
-    # Scrollbar
-    style.configure("Vertical.TScrollbar",
-                     background=t["surface"], troughcolor=t["bg"],
-                     arrowcolor=t["text_dim"])
 
+# Styles whose clam settings are carried into the app themes. theme_create()
+# only inherits clam's elements and layouts, not its configure/map values.
+_BASE_STYLES = (
+    ".", "TButton", "TEntry", "TCombobox", "ComboboxPopdownFrame", "TLabelframe",
+    "TNotebook.Tab", "TPanedwindow", "Sash", "TProgressbar", "TScale",
+    "TScrollbar", "Heading", "Treeview",
+)
+
+
+def _current_settings(style, names):
+    """Read the active theme's configure/map values for the styles in *names*."""
+    settings = {}
+    for name in names:
+        spec = {}
+        configured = style.configure(name)
+        if configured:
+            spec["configure"] = configured
+        mapped = style.map(name)
+        if mapped:
+            spec["map"] = mapped
+        if spec:
+            settings[name] = spec
+    return settings
+
+
+def _merge_settings(base, overrides):
+    """Layer *overrides* on *base* option by option, like configure()/map() would."""
+    merged = {name: {kind: dict(opts) for kind, opts in spec.items()}
+              for name, spec in base.items()}
+    for name, spec in overrides.items():
+        target = merged.setdefault(name, {})
+        for kind, opts in spec.items():
+            target.setdefault(kind, {}).update(opts)
+    return merged
+
+
+def _theme_settings(t):
+    """Build ttk theme settings (for Style.theme_create) from palette *t*."""
+    bg, bg_alt = t.bg, t.bg_alt
+    surface, surface_hl, border = t.surface, t.surface_hl, t.border
+    text, text_dim = t.text, t.text_dim
+    accent, accent_hover, accent_press = t.accent, t.accent_hover, t.accent_press
+    tree_bg, tree_fg = t.tree_bg, t.tree_fg
+    tree_sel_bg, tree_sel_fg = t.tree_sel_bg, t.tree_sel_fg
+    entry_bg, entry_fg, btn_fg = t.entry_bg, t.entry_fg, t.btn_fg
+
+    return {
+        ".": {"configure": {"background": bg, "foreground": text,
+                            "font": (FONT_FAMILY, 10)}},
+
+        # Treeview
+        "Treeview": {
+            "configure": {"background": tree_bg, "foreground": tree_fg,
+                          "fieldbackground": tree_bg,
+                          "rowheight": 28, "font": (FONT_FAMILY, 10),
+                          "borderwidth": 0},
+            "map": {"background": [("selected", tree_sel_bg)],
+                    "foreground": [("selected", tree_sel_fg)]},
+        },
+        "Treeview.Heading": {
+            "configure": {"background": surface, "foreground": text,
+                          "font": (FONT_FAMILY, 10, "bold"), "relief": "flat"},
+            "map": {"background": [("active", surface_hl)]},
+        },
+
+        # Buttons
+        "App.TButton": {
+            "configure": {"font": (FONT_FAMILY, 9, "bold"), "padding": (12, 5),
+                          "background": surface, "foreground": text},
+            "map": {"background": [("active", surface_hl), ("pressed", border)],
+                    "foreground": [("disabled", text_dim)]},
+        },
+        "Accent.TButton": {
+            "configure": {"font": (FONT_FAMILY, 9, "bold"), "padding": (14, 5),
+                          "background": accent, "foreground": btn_fg},
+            "map": {"background": [("active", accent_hover), ("pressed", accent_press)],
+                    "foreground": [("disabled", text_dim)]},
+        },
+
+        # Labels, Frames, Notebooks
+        "TLabel": {"configure": {"background": bg, "foreground": text,
+                                 "font": (FONT_FAMILY, 10)}},
+        "TFrame": {"configure": {"background": bg}},
+        "Top.TFrame": {"configure": {"background": bg}},
+        "Title.TLabel": {"configure": {"background": bg, "foreground": accent,
+                                       "font": (FONT_FAMILY, 16, "bold")}},
+        "Status.TLabel": {"configure": {"background": bg_alt,
+                                        "foreground": text_dim,
+                                        "font": (FONT_FAMILY, 9), "padding": (12, 4)}},
+        "TLabelframe": {"configure": {"background": bg, "foreground": text,
+                                      "font": (FONT_FAMILY, 10, "bold")}},
+        "TLabelframe.Label": {"configure": {"background": bg, "foreground": accent,
+                                            "font": (FONT_FAMILY, 10, "bold")}},
+        "TNotebook": {"configure": {"background": bg}},
+        "TNotebook.Tab": {
+            "configure": {"background": surface, "foreground": text,
+                          "padding": (12, 4), "font": (FONT_FAMILY, 9)},
+            "map": {"background": [("selected", accent)],
+                    "foreground": [("selected", btn_fg)]},
+        },
+
+        # Combobox
+        "TCombobox": {
+            "configure": {"fieldbackground": entry_bg, "foreground": entry_fg,
+                          "background": surface, "arrowcolor": accent,
+                          "font": (FONT_FAMILY, 10)},
+            "map": {"fieldbackground": [("readonly", entry_bg)],
+                    "foreground": [("readonly", entry_fg)]},
+        },
+
+        # Scale
+        "TScale": {"configure": {"background": bg, "troughcolor": surface,
+                                 "sliderthickness": 18}},
+
+        # Progressbar
+        "Horizontal.TProgressbar": {"configure": {"background": accent,
+                                                  "troughcolor": surface,
+                                                  "thickness": 6}},
+
+        # Scrollbar
+        "Vertical.TScrollbar": {"configure": {"background": surface,
+                                              "troughcolor": bg,
+                                              "arrowcolor": text_dim}},
+    }
+
+
+def _register_themes(style):
+    """Create one ttk theme per palette so switching is a single theme_use().
+
+    Each theme starts from the installed clam's own settings, read at startup,
+    with the palette layered on top.
+    """
+    palettes = {name: _theme_settings(palette) for name, palette in THEMES.items()}
+    style.theme_use("clam")
+    names = set(_BASE_STYLES).union(*palettes.values())
+    base = _current_settings(style, sorted(names))
+    for name, settings in palettes.items():
+        style.theme_create(f"app_{name}", parent="clam",
+                           settings=_merge_settings(base, settings))
+
+
+def _apply_theme(root, style, theme_name):
+    """Switch to the registered ttk theme and recolour the root window."""
+    t = THEMES[theme_name]
+    style.theme_use(f"app_{theme_name}")
+    root.configure(bg=t.bg)
     return t
 
 
@@ -182,19 +298,60 @@ def create_gui():
     root.geometry("1060x780")
     root.minsize(860, 600)
 
+    # Model requests run on MAX_WORKERS daemon threads fed by one queue, so
+    # closing the window never waits on an in-flight OpenAI request. Quick
+    # local actions (open, copy) get their own thread and never wait here.
+    jobs = queue.Queue()
+    closed = False
+
+    def _worker():
+        while True:
+            fn, args = jobs.get()
+            if closed:
+                continue
+            try:
+                fn(*args)
+            except Exception:
+                traceback.print_exc()
+
+    for i in range(MAX_WORKERS):
+        threading.Thread(target=_worker, name=f"gui-worker-{i}", daemon=True).start()
+
+    def submit(fn, *args):
+        jobs.put((fn, args))
+
+    def on_tk_thread(fn, *args, idle=False):
+        """Schedule fn(*args) on the Tk thread; a no-op once the window is closed."""
+        if closed:
+            return False
+        try:
+            if idle:
+                root.after_idle(fn, *args)
+            else:
+                root.after(0, fn, *args)
+        except (tk.TclError, RuntimeError):
+            return False
+        return True
+
+    def on_close():
+        nonlocal closed
+        closed = True
+        root.destroy()
+
+    root.protocol("WM_DELETE_WINDOW", on_close)
+
     style = ttk.Style(root)
-    try:
-        style.theme_use("clam")
-    except tk.TclError:
-        pass
+    _register_themes(style)
 
     current_theme = get_theme()
     t = _apply_theme(root, style, current_theme)
 
     # -- Shared state ------------------------------------------------------- #
     recent_files: list = []
+    _proc_cache: dict[tuple[str, str], bool] = {}
     processing_count = tk.IntVar(value=0)
     model_settings = get_model_settings()
+    api_configured = is_configured()
 
     # -- Theme toggle ------------------------------------------------------- #
     def toggle_theme():
@@ -203,21 +360,17 @@ def create_gui():
         set_theme(current_theme)
         t = _apply_theme(root, style, current_theme)
         for w in (log_box, prompt_editor):
-            w.configure(bg=t["log_bg"], fg=t["log_fg"],
-                        insertbackground=t["accent"],
-                        selectbackground=t["accent"], selectforeground=t["btn_fg"])
-        status_bar.configure(bg=t["bg_alt"], fg=t["text_dim"])
-        for child in _all_tk_frames:
-            child.configure(bg=t["bg"])
+            w.configure(bg=t.log_bg, fg=t.log_fg,
+                        insertbackground=t.accent,
+                        selectbackground=t.accent, selectforeground=t.btn_fg)
         theme_btn.configure(text="Light" if current_theme == "dark" else "Dark")
 
     # -- Top bar ------------------------------------------------------------ #
-    top_bar = tk.Frame(root, bg=t["bg"])
+    top_bar = ttk.Frame(root, style="Top.TFrame")
     top_bar.pack(fill="x", padx=12, pady=(10, 0))
 
-    title_lbl = tk.Label(top_bar, text="TXT Transform Studio",
-                          font=(FONT_FAMILY, 16, "bold"),
-                          bg=t["bg"], fg=t["accent"])
+    title_lbl = ttk.Label(top_bar, text="TXT Transform Studio",
+                           style="Title.TLabel")
     title_lbl.pack(side="left")
 
     theme_btn = ttk.Button(
@@ -272,7 +425,7 @@ def create_gui():
     # Action buttons
     btn_bar = ttk.Frame(left_frame)
     btn_bar.pack(fill="x", pady=6)
-    ttk.Button(btn_bar, text="Refresh", command=lambda: refresh_list(),
+    ttk.Button(btn_bar, text="Refresh", command=lambda: force_refresh(),
                style="App.TButton").pack(side="left", padx=(0, 4))
     ttk.Button(btn_bar, text="Add File", command=lambda: add_file(),
                style="App.TButton").pack(side="left", padx=(0, 4))
@@ -301,10 +454,10 @@ def create_gui():
 
     log_box = ScrolledText(left_frame, wrap=tk.WORD,
                             font=(MONO_FAMILY, 9),
-                            bg=t["log_bg"], fg=t["log_fg"],
-                            insertbackground=t["accent"],
-                            selectbackground=t["accent"],
-                            selectforeground=t["btn_fg"],
+                            bg=t.log_bg, fg=t.log_fg,
+                            insertbackground=t.accent,
+                            selectbackground=t.accent,
+                            selectforeground=t.btn_fg,
                             relief="flat", bd=0, padx=8, pady=6,
                             height=10)
     log_box.pack(fill="both", expand=True)
@@ -318,9 +471,10 @@ def create_gui():
     model_frame.pack(fill="x", pady=(0, 8))
 
     ttk.Label(model_frame, text="Model").pack(anchor="w")
-    model_ids = list(SUPPORTED_MODELS)
+    model_ids = list(SUPPORTED_MODEL_ORDER)
     model_names = {m["id"]: m["name"] for m in get_model_catalog()}
     model_display = [f"{model_names.get(mid, mid)}" for mid in model_ids]
+    model_display_idx = _first_index(model_display)
     model_var = tk.StringVar(value=model_display[model_ids.index(model_settings["model"])]
                               if model_settings["model"] in model_ids else model_display[0])
     model_combo = ttk.Combobox(model_frame, textvariable=model_var,
@@ -356,15 +510,17 @@ def create_gui():
 
     # Save settings button
     def save_settings():
-        idx = model_display.index(model_var.get()) if model_var.get() in model_display else 0
+        nonlocal model_settings
+        idx = model_display_idx.get(model_var.get(), 0)
         try:
-            set_model_settings(
+            model_settings = set_model_settings(
                 model=model_ids[idx],
                 temperature=round(temp_var.get(), 2),
                 top_p=round(top_p_var.get(), 2),
                 output_format=fmt_var.get(),
             )
             log("Settings saved.")
+            update_status()
         except Exception as exc:
             log(f"Could not save settings: {exc}")
 
@@ -378,6 +534,7 @@ def create_gui():
     # Preset selector
     presets = get_prompt_presets()
     preset_names = [p["name"] for p in presets]
+    preset_name_idx = _first_index(preset_names)
     preset_ids = [p["id"] for p in presets]
     default_pid = get_default_prompt_id()
     preset_var = tk.StringVar(
@@ -393,17 +550,17 @@ def create_gui():
 
     prompt_editor = ScrolledText(prompt_frame, wrap=tk.WORD,
                                   font=(MONO_FAMILY, 9),
-                                  bg=t["log_bg"], fg=t["log_fg"],
-                                  insertbackground=t["accent"],
-                                  selectbackground=t["accent"],
-                                  selectforeground=t["btn_fg"],
+                                  bg=t.log_bg, fg=t.log_fg,
+                                  insertbackground=t.accent,
+                                  selectbackground=t.accent,
+                                  selectforeground=t.btn_fg,
                                   relief="flat", bd=0, padx=6, pady=6,
                                   height=8)
     prompt_editor.pack(fill="both", expand=True, pady=(0, 6))
 
     def load_preset(*_args):
         name = preset_var.get()
-        idx = preset_names.index(name) if name in preset_names else 0
+        idx = preset_name_idx.get(name, 0)
         prompt_data = get_prompt(preset_ids[idx])
         prompt_editor.delete("1.0", tk.END)
         prompt_editor.insert("1.0", prompt_data.get("content", ""))
@@ -413,21 +570,39 @@ def create_gui():
     active_prompt = get_prompt(default_pid)
     prompt_editor.insert("1.0", active_prompt.get("content", ""))
 
+    # Only copy the editor buffer out of Tk after it has changed.
+    prompt_text = ""
+    prompt_dirty = True
+
+    def _on_prompt_modified(_event):
+        nonlocal prompt_dirty
+        if prompt_editor.edit_modified():
+            prompt_dirty = True
+            prompt_editor.edit_modified(False)
+
+    prompt_editor.bind("<<Modified>>", _on_prompt_modified)
+
+    def current_prompt():
+        nonlocal prompt_text, prompt_dirty
+        if prompt_dirty:
+            prompt_text = prompt_editor.get("1.0", tk.END).strip()
+            prompt_dirty = False
+        return prompt_text
+
     # Prompt action buttons
     prompt_btn_row = ttk.Frame(prompt_frame)
     prompt_btn_row.pack(fill="x")
 
     def save_prompt():
         name = preset_var.get().strip()
-        content = prompt_editor.get("1.0", tk.END).strip()
+        content = current_prompt()
         if not name or not content:
             messagebox.showwarning("Empty", "Prompt name and content cannot be empty.")
             return
-        idx = preset_names.index(name) if name in preset_names else None
+        idx = preset_name_idx.get(name)
         pid = preset_ids[idx] if idx is not None else None
         try:
-            result = upsert_prompt(pid, name, content, set_default=True)
-            set_default_prompt_id(result["id"])
+            upsert_prompt(pid, name, content, set_default=True)
             log(f"Prompt '{name}' saved and set as active.")
             _refresh_presets()
         except Exception as exc:
@@ -440,6 +615,7 @@ def create_gui():
         preset_var.set(name)
         preset_names.append(name)
         preset_ids.append("")
+        preset_name_idx.setdefault(name, len(preset_names) - 1)
         preset_combo.configure(values=preset_names)
 
     def _refresh_presets():
@@ -450,6 +626,8 @@ def create_gui():
         for p in presets:
             preset_names.append(p["name"])
             preset_ids.append(p["id"])
+        preset_name_idx.clear()
+        preset_name_idx.update(_first_index(preset_names))
         preset_combo.configure(values=preset_names)
 
     ttk.Button(prompt_btn_row, text="Save", command=save_prompt,
@@ -458,39 +636,58 @@ def create_gui():
                style="App.TButton").pack(side="left")
 
     # Status bar
-    status_bar = tk.Label(
-        root, anchor="w",
-        font=(FONT_FAMILY, 9),
-        bg=t["bg_alt"], fg=t["text_dim"],
-        padx=12, pady=4,
-    )
+    status_bar = ttk.Label(root, anchor="w", style="Status.TLabel")
     status_bar.pack(fill="x", side="bottom")
 
     def update_status():
-        api_status = "API Key Set" if is_configured() else "No API Key"
-        ms = get_model_settings()
+        api_status = "API Key Set" if api_configured else "No API Key"
         n_files = len(tree.get_children())
         active = processing_count.get()
         active_txt = f" | Processing {active}" if active else ""
         status_bar.configure(
-            text=f"{api_status}  |  {ms['model']}  |  {n_files} files{active_txt}"
+            text=f"{api_status}  |  {model_settings['model']}  |  {n_files} files{active_txt}"
         )
-        root.after(2000, update_status)
 
-    # Collect all tk.Frames for theme toggling
-    _all_tk_frames = [top_bar]
+    processing_count.trace_add("write", lambda *_: update_status())
 
     # ===================================================================== #
     #  Callbacks                                                             #
     # ===================================================================== #
 
+    log_queue = collections.deque()
+    log_flush_pending = False
+
+    def _flush_log():
+        nonlocal log_flush_pending
+        log_flush_pending = False
+        chunks = []
+        while log_queue:
+            chunks.append(log_queue.popleft())
+        if chunks:
+            log_box.insert(tk.END, "".join(chunks))
+            lines = int(log_box.index("end-1c").split(".")[0])
+            if lines > MAX_LOG_LINES:
+                log_box.delete("1.0", f"{lines - MAX_LOG_LINES}.0")
+            log_box.see(tk.END)
+
     def log(msg):
-        log_box.insert(tk.END, msg + "\n")
-        log_box.see(tk.END)
+        # Safe to call from worker threads: messages are queued and written
+        # by one idle callback on the Tk thread.
+        nonlocal log_flush_pending
+        log_queue.append(msg + "\n")
+        if not log_flush_pending:
+            log_flush_pending = on_tk_thread(_flush_log, idle=True)
 
     def processed_status(path: str) -> str:
-        ext = fmt_var.get()
-        return "Yes" if os.path.exists(get_processed_path(path, ext)) else "-"
+        key = (path, fmt_var.get())
+        exists = _proc_cache.get(key)
+        if exists is None:
+            try:
+                exists = stat.S_ISREG(os.stat(get_processed_path(*key)).st_mode)
+            except OSError:
+                exists = False
+            _proc_cache[key] = exists
+        return "Yes" if exists else "-"
 
     def update_processed_status(path: str) -> None:
         if not tree.exists(path):
@@ -505,15 +702,20 @@ def create_gui():
         if not entries:
             log("No .txt files found.")
         else:
+            insert = tree.insert
+            basename = os.path.basename
             for path, mtime, ctime in entries:
-                fname = os.path.basename(path)
-                mod = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M")
-                cre = datetime.fromtimestamp(ctime).strftime("%Y-%m-%d %H:%M")
-                tree.insert("", "end", iid=path,
-                            values=(fname, mod, cre, processed_status(path)))
-            log(f"Refreshed - {len(entries)} file(s) at {datetime.now().strftime('%H:%M:%S')}")
+                insert("", "end", iid=path,
+                       values=(basename(path), _format_ts(mtime), _format_ts(ctime),
+                               processed_status(path)))
+            log(f"Refreshed - {len(entries)} file(s) at {time.strftime('%H:%M:%S')}")
         update_status()
 
+    def force_refresh():
+        invalidate_recent_texts()
+        _proc_cache.clear()
+        refresh_list()
+
     def choose_folder():
         selected = filedialog.askdirectory(
             title="Select folder with TXT files",
@@ -537,19 +739,19 @@ def create_gui():
         if not file_path:
             return
         try:
-            mtime = os.path.getmtime(file_path)
-            ctime = os.path.getctime(file_path)
+            st = os.stat(file_path)
         except OSError:
             messagebox.showerror("File Error", "Could not access file metadata.")
             return
         fname = os.path.basename(file_path)
-        mod = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M")
-        cre = datetime.fromtimestamp(ctime).strftime("%Y-%m-%d %H:%M")
+        mod = _format_ts(st.st_mtime)
+        cre = _format_ts(st.st_ctime)
         recent_files.insert(0, file_path)
         tree.insert("", 0, iid=file_path,
                     values=(fname, mod, cre, processed_status(file_path)))
         tree.selection_set(file_path)
         log(f"Added: {fname}")
+        update_status()
 
     def select_all():
         tree.selection_set(tree.get_children())
@@ -579,41 +781,48 @@ def create_gui():
             return
 
         # Gather current settings
-        idx = model_display.index(model_var.get()) if model_var.get() in model_display else 0
+        idx = model_display_idx.get(model_var.get(), 0)
         cur_model = model_ids[idx]
         cur_temp = round(temp_var.get(), 2)
         cur_top_p = round(top_p_var.get(), 2)
         cur_fmt = fmt_var.get()
-        cur_prompt = prompt_editor.get("1.0", tk.END).strip()
+        cur_prompt = current_prompt()
 
-        progress_bar.pack(fill="x", pady=(4, 0), before=log_label)
-        progress_bar.start(12)
         processing_count.set(processing_count.get() + len(sel))
-        update_status()
+        progress_bar.pack(fill="x", pady=(4, 0), before=log_label)
+        # A lone file gets a static bar; animate only when several are queued.
+        if processing_count.get() > 1:
+            progress_bar.configure(mode="indeterminate")
+            progress_bar.start(50)
+        else:
+            progress_bar.configure(mode="determinate")
+            progress_var.set(0)
+
+        def _done(path):
+            _proc_cache.pop((path, cur_fmt), None)
+            update_processed_status(path)
+            new_count = processing_count.get() - 1
+            processing_count.set(max(0, new_count))
+            if new_count <= 0:
+                progress_bar.stop()
+                progress_bar.pack_forget()
+
+        def _run(path):
+            try:
+                process_file(
+                    path, log,
+                    model=cur_model,
+                    prompt_text=cur_prompt,
+                    temperature=cur_temp,
+                    top_p=cur_top_p,
+                    output_format=cur_fmt,
+                )
+            finally:
+                on_tk_thread(_done, path)
 
         for chosen in sel:
-            def _run(path=chosen):
-                try:
-                    process_file(
-                        path, log,
-                        model=cur_model,
-                        prompt_text=cur_prompt,
-                        temperature=cur_temp,
-                        top_p=cur_top_p,
-                        output_format=cur_fmt,
-                    )
-                finally:
-                    root.after(0, lambda p=path: update_processed_status(p))
-                    new_count = processing_count.get() - 1
-                    processing_count.set(max(0, new_count))
-                    if new_count <= 0:
-                        root.after(0, lambda: (progress_bar.stop(),
-                                               progress_bar.pack_forget()))
-                    root.after(0, update_status)
-
-            threading.Thread(target=_run, daemon=True).start()
+            submit(_run, chosen)
 
     # -- Initial load ------------------------------------------------------- #
     refresh_list()
-    update_status()
     root.mainloop()
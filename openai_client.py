@@ -1,4 +1,5 @@
 import os
+import threading
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -8,23 +9,45 @@ if not api_key:
     print("[DEBUG] OPENAI_API_KEY not set. Configure it before using process features.")
 client = None
 
-from config import PROMPT_PATH
-import openai
+from config import read_system_prompt
 
-if api_key:
-    client = openai.OpenAI(api_key=api_key)
+_client_lock = threading.Lock()
+
+
+def _get_client():
+    """Build the OpenAI client on first use; importing the SDK is slow."""
+    global client
+    if client is None and api_key:
+        with _client_lock:
+            if client is None:
+                import httpx
+                import openai
+
+                # Keep idle connections around between user actions so
+                # follow-up requests skip the TCP/TLS handshake (httpx drops
+                # them after 5s by default).
+                limits = httpx.Limits(
+                    max_connections=16,
+                    max_keepalive_connections=8,
+                    keepalive_expiry=120.0,
+                )
+                client = openai.OpenAI(
+                    api_key=api_key,
+                    http_client=openai.DefaultHttpxClient(limits=limits),
+                )
+    return client
 
 
 def is_configured() -> bool:
-    return client is not None
+    return bool(api_key)
 
 
 def ask_chatgpt(text, model="gpt-4.1", system_prompt=None, temperature=None, top_p=None):
-    if client is None:
+    api = _get_client()
+    if api is None:
         raise RuntimeError("OPENAI_API_KEY environment variable not set.")
     if system_prompt is None:
-        with open(PROMPT_PATH, "r", encoding="utf-8") as pf:
-            system_prompt = pf.read()
+        system_prompt = read_system_prompt(missing_ok=False)
     import time
 
     t0 = time.time()
@@ -39,7 +62,7 @@ def ask_chatgpt(text, model="gpt-4.1", system_prompt=None, temperature=None, top
         payload["temperature"] = float(temperature)
     if top_p is not None:
         payload["top_p"] = float(top_p)
-    resp = client.chat.completions.create(**payload)
+    resp = api.chat.completions.create(**payload)
     t1 = time.time()
     usage = resp.usage
     return resp.choices[0].message.content.strip(), {